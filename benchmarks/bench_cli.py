@@ -0,0 +1,53 @@
+"""
+CLI cold start: a fresh interpreter running each subcommand once.
+
+Run from the repo root:
+
+    PYTHONPATH=src python benchmarks/bench_cli.py
+"""
+
+from __future__ import annotations
+
+import atexit
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from harness import Case, fmt_seconds, measure
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+
+def _cold_start(*argv: str):
+    def setup():
+        env = {**os.environ, "PYTHONPATH": str(SRC)}
+        cmd = [sys.executable, str(SRC / "cli.py"), *argv]
+        return lambda: subprocess.run(cmd, env=env, stdout=subprocess.DEVNULL, check=True)
+
+    return setup
+
+
+def _validate_config_setup():
+    fd, path = tempfile.mkstemp(suffix=".yaml", prefix="bench-cli-")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write("service_name: billing-api\n")
+    atexit.register(os.unlink, path)
+    return _cold_start("validate-config", path)()
+
+
+def _baseline_setup():
+    return lambda: subprocess.run([sys.executable, "-c", "pass"], check=True)
+
+
+CASES = [
+    Case("cli.cold_start.python", _baseline_setup, number=10),
+    Case("cli.cold_start.parse_date", _cold_start("parse-date", "01/31/2026"), number=10),
+    Case("cli.cold_start.validate_config", _validate_config_setup, number=10),
+]
+
+
+if __name__ == "__main__":
+    for case in CASES:
+        print(f"{case.name:<36} {fmt_seconds(measure(case)['seconds'])}")
@@ -0,0 +1,69 @@
+"""
+load_yaml_config() on small and large configs, cold (full YAML parse) and cached.
+
+Run from the repo root:
+
+    PYTHONPATH=src python benchmarks/bench_config.py
+"""
+
+from __future__ import annotations
+
+import atexit
+import shutil
+import tempfile
+from pathlib import Path
+
+from harness import Case, fmt_seconds, measure
+
+from utils.config import load_yaml_config
+
+_tmpdir: Path | None = None
+
+
+def _write(name: str, services: int) -> Path:
+    global _tmpdir
+    if _tmpdir is None:
+        _tmpdir = Path(tempfile.mkdtemp(prefix="bench-config-"))
+        atexit.register(shutil.rmtree, _tmpdir, True)
+    lines = ["service_name: billing-api", "environment: prod", "dependencies:"]
+    for i in range(services):
+        lines += [
+            f"  - name: svc-{i}",
+            f"    url: https://svc-{i}.internal.example.com",
+            "    timeout_ms: 2500",
+            "    retries: 3",
+            f"    tags: [tier-{i % 3}, team-{i % 7}]",
+        ]
+    path = _tmpdir / name
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return path
+
+
+def _cold(services: int):
+    def setup():
+        path = _write(f"cold-{services}.yaml", services)
+        return lambda: load_yaml_config(path, use_cache=False)
+
+    return setup
+
+
+def _cached(services: int):
+    def setup():
+        path = _write(f"cached-{services}.yaml", services)
+        load_yaml_config(path)
+        return lambda: load_yaml_config(path)
+
+    return setup
+
+
+CASES = [
+    Case("config.load.small.cold", _cold(5), number=200),
+    Case("config.load.small.cached", _cached(5), number=2_000),
+    Case("config.load.large.cold", _cold(2_000), number=5),
+    Case("config.load.large.cached", _cached(2_000), number=20),
+]
+
+
+if __name__ == "__main__":
+    for case in CASES:
+        print(f"{case.name:<32} {fmt_seconds(measure(case)['seconds'])}")
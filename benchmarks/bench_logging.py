@@ -0,0 +1,104 @@
+"""
+Compare get_logger() emit throughput in stream and queue mode under many threads.
+
+Each write to the sink can be given an artificial latency to model a slow
+stderr (pipe to a log shipper, terminal, network filesystem). Run from the
+repo root:
+
+    PYTHONPATH=src python benchmarks/bench_logging.py
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import tempfile
+import threading
+import time
+
+from harness import Case
+
+from utils.logging import flush_queues, get_logger
+
+
+class _Sink:
+    """File-backed stream whose write() costs at least `latency` seconds."""
+
+    def __init__(self, latency: float) -> None:
+        self._file = tempfile.TemporaryFile("w")
+        self._latency = latency
+
+    def write(self, s: str) -> int:
+        if self._latency:
+            time.sleep(self._latency)
+        return self._file.write(s)
+
+    def flush(self) -> None:
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def run(mode: str, threads: int = 16, records: int = 2_000, latency: float = 0.0) -> tuple[float, float]:
+    """
+    Return (caller, total) records/sec for `threads` threads: caller is how
+    fast the logging calls return, total includes the final flush.
+    """
+    name = f"bench-{mode}-{threads}-{time.perf_counter_ns()}"
+    sink = _Sink(latency)
+    with contextlib.redirect_stderr(sink):
+        logger = get_logger(name, mode=mode)
+
+    def work() -> None:
+        for i in range(records):
+            logger.info("request handled id=%d status=%s", i, "ok")
+
+    workers = [threading.Thread(target=work) for _ in range(threads)]
+    t0 = time.perf_counter()
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    caller = time.perf_counter() - t0
+    flush_queues()
+    total = time.perf_counter() - t0
+
+    # Each run has its own sink, so tear down its writer thread and logger
+    # rather than let them pile up and skew later cases.
+    for handler in list(logger.handlers):
+        writer = getattr(handler, "writer", None)
+        if writer is not None:
+            writer.stop()
+        logger.removeHandler(handler)
+    logging.Logger.manager.loggerDict.pop(name, None)
+    sink.close()
+    return threads * records / caller, threads * records / total
+
+
+def _emit_case(mode: str, threads: int, records: int = 1_000):
+    def setup():
+        return lambda: run(mode, threads, records)
+
+    return setup
+
+
+CASES = [
+    Case("logging.emit.stream.16x1000", _emit_case("stream", 16), number=1),
+    Case("logging.emit.queue.16x1000", _emit_case("queue", 16), number=1),
+]
+
+
+def main() -> None:
+    for latency_us in (0, 20):
+        for threads in (1, 16):
+            stream, _ = run("stream", threads, latency=latency_us / 1e6)
+            caller, total = run("queue", threads, latency=latency_us / 1e6)
+            print(
+                f"write latency {latency_us:>2}us threads={threads:<3} stream {stream:9,.0f} rec/s   "
+                f"queue {caller:9,.0f} rec/s caller-side ({caller / stream:.2f}x), {total:9,.0f} rec/s incl. flush"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Tiny stdlib-only benchmark harness shared by benchmarks/run.py and the bench_* modules.
+
+A Case builds its workload in setup() (excluded from timing) and returns a
+zero-argument callable; the harness reports the best per-call time over
+several repeats, which is the least noisy statistic on shared machines.
+"""
+
+from __future__ import annotations
+
+import json
+import platform
+import sys
+import time
+import timeit
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+
+@dataclass(frozen=True)
+class Case:
+    name: str
+    setup: Callable[[], Callable[[], object]]
+    number: int = 1
+    repeat: int = 5
+
+
+def measure(case: Case, quick: bool = False) -> dict[str, Any]:
+    fn = case.setup()
+    number = max(1, case.number // 10) if quick else case.number
+    repeat = 2 if quick else case.repeat
+    runs = timeit.Timer(fn).repeat(repeat=repeat, number=number)
+    return {"seconds": min(runs) / number, "number": number, "repeat": repeat}
+
+
+def save(results: dict[str, dict[str, Any]], path: Path) -> None:
+    payload = {
+        "meta": {
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        },
+        "results": results,
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def load(path: Path) -> dict[str, dict[str, Any]]:
+    return json.loads(path.read_text(encoding="utf-8"))["results"]
+
+
+def compare(
+    baseline: dict[str, dict[str, Any]], current: dict[str, dict[str, Any]], threshold_pct: float
+) -> list[tuple[str, float, float, float, bool]]:
+    """
+    Return (name, baseline_s, current_s, change_pct, regressed) for every case
+    present in both runs. A case regresses when it got slower by more than
+    threshold_pct percent.
+    """
+    rows = []
+    for name in sorted(current.keys() & baseline.keys()):
+        old = baseline[name]["seconds"]
+        new = current[name]["seconds"]
+        change = (new - old) / old * 100 if old else 0.0
+        rows.append((name, old, new, change, change > threshold_pct))
+    return rows
+
+
+def missing(baseline: dict[str, dict[str, Any]], current: dict[str, dict[str, Any]]) -> list[str]:
+    """Baseline cases absent from the current run (renamed, removed or filtered out)."""
+    return sorted(baseline.keys() - current.keys())
+
+
+def fmt_seconds(s: float) -> str:
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if s >= scale:
+            return f"{s / scale:8.2f} {unit}"
+    return f"{s / 1e-9:8.2f} ns"
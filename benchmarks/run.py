@@ -0,0 +1,75 @@
+"""
+Run the benchmark suite, optionally saving results and gating on a baseline.
+
+    PYTHONPATH=src python benchmarks/run.py                                  # print results
+    PYTHONPATH=src python benchmarks/run.py --save benchmarks/baseline.json  # record a baseline
+    PYTHONPATH=src python benchmarks/run.py --compare benchmarks/baseline.json --threshold 10
+
+With --compare the exit code is 1 if any case got slower than the baseline by
+more than --threshold percent, or if a baseline case did not run (unless
+--filter deliberately selected a subset). Baselines are machine-specific: record and
+compare on the same host.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+import bench_cli
+import bench_config
+import bench_dates
+import bench_logging
+from harness import compare, fmt_seconds, load, measure, missing, save
+
+SUITES = [bench_dates, bench_config, bench_logging, bench_cli]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="benchmarks/run.py")
+    parser.add_argument("-k", "--filter", default="", help="Only run cases whose name contains this substring")
+    parser.add_argument("--quick", action="store_true", help="Fewer iterations; for smoke-testing the suite")
+    parser.add_argument("--save", type=Path, metavar="PATH", help="Write results as JSON to PATH")
+    parser.add_argument("--compare", type=Path, metavar="PATH", help="Baseline JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=10.0, help="Allowed slowdown in percent (default: 10)")
+    args = parser.parse_args(argv)
+
+    results = {}
+    for suite in SUITES:
+        for case in suite.CASES:
+            if args.filter not in case.name:
+                continue
+            results[case.name] = measure(case, quick=args.quick)
+            print(f"{case.name:<40} {fmt_seconds(results[case.name]['seconds'])}", flush=True)
+
+    if args.save:
+        save(results, args.save)
+        print(f"saved {len(results)} results to {args.save}")
+
+    if not args.compare:
+        return 0
+
+    baseline = load(args.compare)
+    rows = compare(baseline, results, args.threshold)
+    print(f"\ncompared with {args.compare} (threshold {args.threshold:g}%)")
+    for name, old, new, change, regressed in rows:
+        flag = "REGRESSED" if regressed else "ok"
+        print(f"{name:<40} {fmt_seconds(old)} -> {fmt_seconds(new)}  {change:+7.1f}%  {flag}")
+    absent = missing(baseline, results)
+    for name in absent:
+        print(f"{name:<40} missing from this run{'' if args.filter else '  FAILED'}")
+
+    failed = False
+    regressions = [row[0] for row in rows if row[4]]
+    if regressions:
+        print(f"\n{len(regressions)} regression(s): {', '.join(regressions)}", file=sys.stderr)
+        failed = True
+    if absent and not args.filter:
+        print(f"\n{len(absent)} baseline case(s) did not run: {', '.join(absent)}", file=sys.stderr)
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
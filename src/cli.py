@@ -1,38 +1,434 @@
 from __future__ import annotations
 
+# Keep module-level imports to the stdlib minimum: this CLI runs thousands of
+# times a day from cron and shell loops, so each subcommand imports what it
+# needs inside its handler. tests/test_cli.py guards parse-date against heavy imports.
 import argparse
-import json
-from pathlib import Path
+import sys
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, TextIO
 
-from utils.config import load_yaml_config
-from utils.dates import parse_date
+if TYPE_CHECKING:
+    from pathlib import Path
 
+    from utils.dates import ParsedDates
 
-def main(argv: list[str] | None = None) -> int:
-    parser = argparse.ArgumentParser(prog="enterprise-internal-utils")
-    sub = parser.add_subparsers(dest="cmd", required=True)
 
-    p_parse = sub.add_parser("parse-date", help="Parse a date string into ISO-8601 (YYYY-MM-DD)")
-    p_parse.add_argument("date_str", help='Date string like "01/31/2026" or "31/01/2026"')
+class _Timings:
+    """
+    Wall-clock time per CLI phase, reported on stderr with --timings.
+
+    Phases can nest: a helper can wrap its lazy imports in phase("import")
+    while the caller is inside phase("run"), and that time is counted once,
+    under "import".
+    """
+
+    def __init__(self) -> None:
+        self.phases: dict[str, float] = {}
+        self._nested: list[float] = []
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        t0 = time.perf_counter()
+        self._nested.append(0.0)
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - t0
+            self.phases[name] = self.phases.get(name, 0.0) + elapsed - self._nested.pop()
+            if self._nested:
+                self._nested[-1] += elapsed
+
+    def report(self, stream: TextIO) -> None:
+        for name, elapsed in self.phases.items():
+            stream.write(f"[timings] {name:<10} {elapsed * 1e3:8.2f} ms\n")
+
+
+def _iter_chunks(
+    stream: TextIO, column: int | None, delimiter: str, chunk_size: int, timings: _Timings
+) -> Iterator[tuple[list[int], list[str | None]]]:
+    """
+    Yield (line_numbers, values) chunks from a line or CSV stream without
+    reading the whole input into memory.
+    """
+    with timings.phase("import"):
+        from itertools import islice
+
+        if column is not None:
+            import csv
+
+    if column is None:
+        rows = ((n, line.rstrip("\r\n")) for n, line in enumerate(stream, 1))
+    else:
+        reader = csv.reader(stream, delimiter=delimiter)
+        rows = ((reader.line_num, row[column] if column < len(row) else None) for row in reader)
+
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            return
+        yield [n for n, _ in chunk], [v for _, v in chunk]
+
+
+def _in_worker(fn: Callable[..., Any], collect_metrics: bool, *args: Any) -> tuple[Any, dict | None]:
+    """
+    Run fn(*args) in a pool worker and return (result, metrics snapshot).
+    Metrics counted in worker processes would otherwise never reach the
+    parent's --stats / UTILS_METRICS_DUMP output.
+    """
+    from utils import metrics
+
+    if not collect_metrics:
+        return fn(*args), None
+    metrics.enable()
+    metrics.reset()  # forked workers inherit the parent's counters
+    return fn(*args), metrics.snapshot()
+
+
+def _worker_result(fut_result: tuple[Any, dict | None]) -> Any:
+    from utils import metrics
+
+    result, snap = fut_result
+    if snap is not None:
+        metrics.merge(snap)
+    return result
+
+
+def _parse_chunks(
+    chunks: Iterator[tuple[list[int], list[str | None]]], workers: int, timings: _Timings
+) -> Iterator[tuple[list[int], list[str | None], ParsedDates]]:
+    """
+    Parse chunks in order, optionally across a process pool. At most
+    2 * workers chunks are in flight, so memory stays bounded.
+    """
+    with timings.phase("import"):
+        from utils.dates import parse_dates
+
+        if workers > 1:
+            from collections import deque
+            from concurrent.futures import ProcessPoolExecutor
 
-    p_cfg = sub.add_parser("validate-config", help="Load a YAML config and print normalized JSON")
-    p_cfg.add_argument("path", type=str, help="Path to YAML config file")
+            from utils import metrics
 
-    args = parser.parse_args(argv)
+    if workers <= 1:
+        for lines, values in chunks:
+            yield lines, values, parse_dates(values)
+        return
 
-    if args.cmd == "parse-date":
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending: deque = deque()
+        for lines, values in chunks:
+            pending.append((lines, values, pool.submit(_in_worker, parse_dates, metrics.enabled, values)))
+            if len(pending) >= workers * 2:
+                lines, values, fut = pending.popleft()
+                yield lines, values, _worker_result(fut.result())
+        while pending:
+            lines, values, fut = pending.popleft()
+            yield lines, values, _worker_result(fut.result())
+
+
+# Keeps a rejected value on one LINE<TAB>VALUE line (quoted CSV fields may hold newlines).
+_REJECT_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def _stream_parse_dates(args: argparse.Namespace, timings: _Timings) -> int:
+    with timings.phase("import"):
+        from datetime import date
+
+    src = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8", newline="")
+    rejects = sys.stderr if args.rejects is None else open(args.rejects, "w", encoding="utf-8")
+    iso: dict[int, str] = {}
+    rejected = 0
+    try:
+        chunks = _iter_chunks(src, args.column, args.delimiter, args.chunk_size, timings)
+        for lines, values, result in _parse_chunks(chunks, args.workers, timings):
+            out = []
+            for n, value, o, bad in zip(lines, values, result.values, result.errors):
+                if bad:
+                    rejected += 1
+                    rejects.write(f"{n}\t{(value or '').translate(_REJECT_ESCAPES)}\n")
+                    continue
+                s = iso.get(o)
+                if s is None:
+                    s = iso[o] = date.fromordinal(o).isoformat()
+                out.append(s)
+            if out:
+                sys.stdout.write("\n".join(out) + "\n")
+    finally:
+        if src is not sys.stdin:
+            src.close()
+        if rejects is not sys.stderr:
+            rejects.close()
+
+    return 1 if rejected else 0
+
+
+def _cmd_parse_date(args: argparse.Namespace, timings: _Timings) -> int:
+    if args.input is not None:
+        # The streaming helpers time their own lazy imports as nested phases.
+        with timings.phase("run"):
+            return _stream_parse_dates(args, timings)
+
+    with timings.phase("import"):
+        from utils.dates import parse_date
+
+    with timings.phase("run"):
         dt = parse_date(args.date_str)
         print(dt.isoformat())
-        return 0
+    return 0
+
+
+# Bump when load_yaml_config's validation rules change, to invalidate old caches.
+_VALIDATE_CACHE_VERSION = 1
+
+
+def _validate_one(path: str, timings: _Timings | None = None) -> tuple[str | None, float]:
+    """
+    Load one config; return (error message or None, seconds spent). Pool
+    workers pass no timings: their import time isn't reported.
+    """
+    with (timings or _Timings()).phase("import"):
+        from pathlib import Path
+
+        from utils.config import ConfigError, load_yaml_config
+
+    t0 = time.perf_counter()
+    try:
+        load_yaml_config(Path(path), use_cache=False)
+    except ConfigError as e:
+        return str(e), time.perf_counter() - t0
+    return None, time.perf_counter() - t0
+
+
+def _load_validate_cache(path: Path) -> dict:
+    import json
 
-    if args.cmd == "validate-config":
+    try:
+        cache = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {"files": {}, "results": {}}
+    if not isinstance(cache, dict) or cache.get("version") != _VALIDATE_CACHE_VERSION:
+        return {"files": {}, "results": {}}
+    return cache
+
+
+def _default_validate_cache(root: Path) -> Path:
+    """Per-tree cache under the user cache dir, so the validated tree stays clean."""
+    import hashlib
+    import os
+    from pathlib import Path
+
+    base = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    key = hashlib.sha256(str(root.resolve()).encode("utf-8")).hexdigest()[:16]
+    return base / "enterprise-internal-utils" / f"validate-config-{key}.json"
+
+
+def _save_validate_cache(path: Path, cache: dict) -> None:
+    # Best effort: an unwritable cache location must not fail the run.
+    import json
+    import os
+
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(json.dumps(cache), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError as e:
+        sys.stderr.write(f"warning: could not write result cache {path}: {e}\n")
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+
+
+def _validate_tree(args: argparse.Namespace, timings: _Timings) -> int:
+    """
+    Validate every config under a directory, printing one JSON line per file.
+
+    Files are hashed first; each distinct content is parsed once (in parallel
+    with --workers), and results are kept in a cache keyed by content hash so
+    unchanged files are skipped on the next run. A file whose mtime and size
+    match the cache is not even re-read. Files that can't be read get an
+    error record instead of aborting the run. Matching no files at all is
+    reported as a failure.
+    """
+    with timings.phase("import"):
+        import hashlib
+        import json
+        from pathlib import Path
+
+        if args.workers > 1:
+            from concurrent.futures import ProcessPoolExecutor
+            from functools import partial
+
+            from utils import metrics
+
+    root = Path(args.recursive)
+    cache_path = None
+    if not args.no_cache:
+        cache_path = Path(args.cache) if args.cache else _default_validate_cache(root)
+    files = sorted(p for p in root.rglob(args.glob) if p.is_file() and p != cache_path)
+    if not files:
+        # An empty match is almost always a wrong DIR or --glob; don't let a CI gate pass on it.
+        sys.stderr.write(f"error: no files under {root} match {args.glob!r}\n")
+        return 1
+    cache = _load_validate_cache(cache_path) if cache_path else {"files": {}, "results": {}}
+    known_files, known_results = cache["files"], cache["results"]
+
+    digests: dict[Path, str] = {}
+    read_errors: dict[Path, str] = {}
+    for p in files:
+        try:
+            st = p.stat()
+            entry = known_files.get(str(p))
+            if entry and entry["mtime_ns"] == st.st_mtime_ns and entry["size"] == st.st_size:
+                digests[p] = entry["sha256"]
+            else:
+                digests[p] = hashlib.sha256(p.read_bytes()).hexdigest()
+                known_files[str(p)] = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "sha256": digests[p]}
+        except OSError as e:
+            read_errors[p] = f"Failed to read config: {p}: {e.strerror or e}"
+
+    # One representative path per content hash that has no cached result.
+    todo: dict[str, str] = {}
+    for p, digest in digests.items():
+        if digest not in known_results:
+            todo.setdefault(digest, str(p))
+
+    fresh: dict[str, tuple[str | None, float]] = {}
+    if args.workers > 1 and len(todo) > 1:
+        run = partial(_in_worker, _validate_one, metrics.enabled)
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            results = pool.map(run, todo.values(), chunksize=16)
+            fresh = dict(zip(todo, map(_worker_result, results)))
+    else:
+        fresh = {digest: _validate_one(path, timings) for digest, path in todo.items()}
+
+    for digest, (error, _) in fresh.items():
+        known_results[digest] = {"status": "error" if error else "ok", "error": error}
+
+    failed = 0
+    parsed: set[str] = set()
+    for p in files:
+        if p in read_errors:
+            failed += 1
+            record = {"path": str(p), "status": "error", "sha256": None, "source": "read", "ms": 0.0}
+            record["error"] = read_errors[p]
+            sys.stdout.write(json.dumps(record) + "\n")
+            continue
+        digest = digests[p]
+        result = known_results[digest]
+        if digest in fresh and digest not in parsed:
+            parsed.add(digest)
+            source, ms = "parsed", fresh[digest][1] * 1e3
+        else:
+            source, ms = ("dedup" if digest in fresh else "cache"), 0.0
+        record = {"path": str(p), "status": result["status"], "sha256": digest, "source": source, "ms": round(ms, 3)}
+        if result["error"]:
+            record["error"] = result["error"]
+            failed += 1
+        sys.stdout.write(json.dumps(record) + "\n")
+
+    if cache_path:
+        # Drop entries for files that no longer exist so the cache doesn't grow forever.
+        live = {str(p) for p in digests}
+        cache = {
+            "version": _VALIDATE_CACHE_VERSION,
+            "files": {k: v for k, v in known_files.items() if k in live},
+            "results": {d: known_results[d] for d in set(digests.values())},
+        }
+        _save_validate_cache(cache_path, cache)
+
+    return 1 if failed else 0
+
+
+def _cmd_validate_config(args: argparse.Namespace, timings: _Timings) -> int:
+    if args.recursive is not None:
+        # _validate_tree and _validate_one time their own lazy imports as nested phases.
+        with timings.phase("run"):
+            return _validate_tree(args, timings)
+
+    with timings.phase("import"):
+        import json
+        from pathlib import Path
+
+        from utils.config import load_yaml_config
+
+    with timings.phase("run"):
         cfg = load_yaml_config(Path(args.path))
         print(json.dumps(cfg, indent=2, sort_keys=True))
-        return 0
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    timings = _Timings()
+    with timings.phase("parse-args"):
+        parser = argparse.ArgumentParser(prog="enterprise-internal-utils")
+        parser.add_argument("--timings", action="store_true", help="Report import/run time per phase on stderr")
+        parser.add_argument("--stats", action="store_true", help="Collect utils metrics and print them as JSON on stderr")
+        sub = parser.add_subparsers(dest="cmd", required=True)
 
-    return 2
+        p_parse = sub.add_parser("parse-date", help="Parse a date string into ISO-8601 (YYYY-MM-DD)")
+        p_parse.add_argument("date_str", nargs="?", help='Date string like "01/31/2026" or "31/01/2026"')
+        p_parse.add_argument("--input", metavar="FILE", help="Stream dates from FILE ('-' for stdin), one per line/row")
+        p_parse.add_argument("--column", type=int, help="0-based CSV column holding the date (default: whole line)")
+        p_parse.add_argument("--delimiter", default=",", help="CSV delimiter used with --column (default: ',')")
+        p_parse.add_argument("--workers", type=int, default=1, help="Parse chunks across N processes (default: 1)")
+        p_parse.add_argument("--rejects", metavar="FILE", help="Write bad rows as LINE<TAB>VALUE here (default: stderr)")
+        p_parse.add_argument("--chunk-size", type=int, default=10_000, help=argparse.SUPPRESS)
+        p_parse.set_defaults(handler=_cmd_parse_date)
+
+        p_cfg = sub.add_parser("validate-config", help="Load a YAML config and print normalized JSON")
+        p_cfg.add_argument("path", type=str, nargs="?", help="Path to YAML config file")
+        p_cfg.add_argument(
+            "--recursive", metavar="DIR", help="Validate every matching file under DIR; prints JSON lines"
+        )
+        p_cfg.add_argument("--glob", default="*.yaml", help="File pattern used with --recursive (default: '*.yaml')")
+        p_cfg.add_argument("--workers", type=int, default=1, help="Parse files across N processes (default: 1)")
+        p_cfg.add_argument(
+            "--cache", metavar="FILE", help="Result cache (default: under $XDG_CACHE_HOME or ~/.cache, keyed by DIR)"
+        )
+        p_cfg.add_argument("--no-cache", action="store_true", help="Don't read or write the result cache")
+        p_cfg.set_defaults(handler=_cmd_validate_config)
+
+        args = parser.parse_args(argv)
+
+        if args.cmd == "parse-date":
+            if (args.date_str is None) == (args.input is None):
+                p_parse.error("pass either DATE_STR or --input")
+            if args.column is not None and args.column < 0:
+                p_parse.error("--column must be >= 0")
+            if len(args.delimiter) != 1:
+                p_parse.error("--delimiter must be a single character")
+            if args.workers < 1 or args.chunk_size < 1:
+                p_parse.error("--workers and --chunk-size must be >= 1")
+
+        if args.cmd == "validate-config":
+            if (args.path is None) == (args.recursive is None):
+                p_cfg.error("pass either PATH or --recursive DIR")
+            if args.workers < 1:
+                p_cfg.error("--workers must be >= 1")
+            if args.recursive is not None:
+                import os
+
+                if not os.path.isdir(args.recursive):
+                    p_cfg.error(f"--recursive: not a directory: {args.recursive}")
+
+    if args.stats:
+        from utils import metrics
+
+        metrics.enable()
+
+    try:
+        return args.handler(args, timings)
+    finally:
+        if args.timings:
+            timings.report(sys.stderr)
+        if args.stats:
+            metrics.dump("-")
 
 
 if __name__ == "__main__":
     raise SystemExit(main())
-
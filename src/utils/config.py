@@ -1,29 +1,72 @@
 from __future__ import annotations
 
+import copy
+import hashlib
+import marshal
+import os
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+from utils import metrics
+
+# libyaml's C loader is several times faster; fall back to pure Python.
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+_CACHE_MAXSIZE = 64
+_cache: OrderedDict[tuple[str, int, int, str], dict[str, Any]] = OrderedDict()
+_cache_lock = threading.Lock()
+
+# Bumped whenever the snapshot layout or normalization rules change.
+_SNAPSHOT_VERSION = 1
+
 
 class ConfigError(ValueError):
     pass
 
 
-def load_yaml_config(path: Path) -> dict[str, Any]:
-    """
-    Load a YAML config file.
+def clear_config_cache() -> None:
+    """Drop all in-process cached configs."""
+    with _cache_lock:
+        _cache.clear()
 
-    Enterprise-ish behavior:
-      - requires the file exist
-      - requires it parse to a mapping/dict at top level
-      - normalizes some expected keys for downstream services
-    """
-    if not path.exists():
-        raise ConfigError(f"Config not found: {path}")
 
+def _snapshot_path(path: Path) -> Path:
+    return path.with_name(f".{path.name}.snapshot")
+
+
+def _read_snapshot(path: Path, digest: str) -> dict[str, Any] | None:
     try:
-        raw = yaml.safe_load(path.read_text(encoding="utf-8"))
+        version, src_digest, cfg = marshal.loads(_snapshot_path(path).read_bytes())
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if version != _SNAPSHOT_VERSION or src_digest != digest or not isinstance(cfg, dict):
+        return None
+    return cfg
+
+
+def _write_snapshot(path: Path, digest: str, cfg: dict[str, Any]) -> None:
+    # Best effort: configs holding non-marshallable values (dates, custom
+    # tags) or living in read-only directories simply don't get a snapshot.
+    target = _snapshot_path(path)
+    tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_bytes(marshal.dumps((_SNAPSHOT_VERSION, digest, cfg)))
+        os.replace(tmp, target)
+    except (OSError, ValueError):
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+
+
+def _parse_config(data: bytes, path: Path) -> dict[str, Any]:
+    try:
+        raw = yaml.load(data.decode("utf-8"), Loader=_Loader)
     except Exception as e:
         raise ConfigError(f"Failed to parse YAML: {path}") from e
 
@@ -40,3 +83,67 @@ def load_yaml_config(path: Path) -> dict[str, Any]:
 
     return raw
 
+
+def load_yaml_config(path: Path, *, use_cache: bool = True, snapshot: bool = False) -> dict[str, Any]:
+    """
+    Load a YAML config file.
+
+    Enterprise-ish behavior:
+      - requires the file exist
+      - requires it parse to a mapping/dict at top level
+      - normalizes some expected keys for downstream services
+
+    Parsed configs are cached in-process (LRU, keyed on path, mtime, size and
+    content hash); every call returns a fresh deep copy, so callers may mutate
+    the result freely. With snapshot=True a marshal sidecar
+    (".<name>.snapshot") is kept next to the file so later processes can skip
+    YAML parsing while the source content is unchanged.
+    """
+    try:
+        st = path.stat()
+        data = path.read_bytes()
+    except FileNotFoundError:
+        raise ConfigError(f"Config not found: {path}") from None
+    except OSError as e:
+        raise ConfigError(f"Failed to read config: {path}") from e
+
+    digest = hashlib.sha256(data).hexdigest()
+    key = (str(path.resolve()), st.st_mtime_ns, st.st_size, digest)
+
+    if use_cache:
+        with _cache_lock:
+            cfg = _cache.get(key)
+            if cfg is not None:
+                _cache.move_to_end(key)
+        if cfg is not None:
+            if metrics.enabled:
+                metrics.incr("config.cache.hits")
+            return copy.deepcopy(cfg)
+        if metrics.enabled:
+            metrics.incr("config.cache.misses")
+
+    cfg = _read_snapshot(path, digest) if snapshot else None
+    if cfg is not None:
+        if metrics.enabled:
+            metrics.incr("config.snapshot.hits")
+    else:
+        t0 = time.perf_counter()
+        try:
+            cfg = _parse_config(data, path)
+        except ConfigError:
+            if metrics.enabled:
+                metrics.incr("config.parse.errors")
+            raise
+        if metrics.enabled:
+            metrics.observe("config.parse.seconds", time.perf_counter() - t0)
+        if snapshot:
+            _write_snapshot(path, digest, cfg)
+
+    if use_cache:
+        with _cache_lock:
+            _cache[key] = cfg
+            if len(_cache) > _CACHE_MAXSIZE:
+                _cache.popitem(last=False)
+        return copy.deepcopy(cfg)
+
+    return cfg
@@ -1,19 +1,449 @@
 from __future__ import annotations
 
+import atexit
+import json
 import logging
+import os
+import random
+import sys
+import threading
+import time
+from collections import deque
+from json.encoder import encode_basestring as _json_str
+from typing import Any
 
+from utils import metrics
 
-def get_logger(name: str, level: str = "INFO") -> logging.Logger:
+_FORMAT = "%(asctime)s %(levelname)s %(name)s - %(message)s"
+_MODES = ("stream", "queue")
+_FORMATS = ("text", "json")
+_OVERFLOW_POLICIES = ("block", "drop_oldest", "drop_newest")
+
+# (id(stream), queue_size, batch_size, overflow) -> writer shared by queue-mode loggers.
+_writers: dict[tuple[int, int, int, str], _BatchWriter] = {}
+_writers_lock = threading.Lock()
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    One JSON object per line:
+      {"ts": "2026-01-31T12:00:00.123Z", "level": ..., "logger": ..., "msg": ..., <fields>, "exc": ...}
+
+    The timestamp is formatted once per second and `fields` (bound per
+    logger) are encoded once up front, so each record costs a handful of
+    string escapes and one f-string.
+    """
+
+    def __init__(self, fields: dict[str, Any] | None = None) -> None:
+        super().__init__()
+        self._fields = "".join(
+            f",{_json_str(str(k))}:{json.dumps(v, default=str)}" for k, v in (fields or {}).items()
+        )
+        self._ts: tuple[int, str] = (-1, "")
+
+    def _timestamp(self, record: logging.LogRecord) -> str:
+        sec = int(record.created)
+        cached_sec, prefix = self._ts
+        if sec != cached_sec:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+            self._ts = (sec, prefix)
+        return f"{prefix}.{int(record.msecs):03d}Z"
+
+    def format(self, record: logging.LogRecord) -> str:
+        extra = self._fields
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            extra = f'{extra},"exc":{_json_str(record.exc_text)}'
+        if record.stack_info:
+            extra = f'{extra},"stack":{_json_str(record.stack_info)}'
+        return (
+            f'{{"ts":"{self._timestamp(record)}","level":{_json_str(record.levelname)},'
+            f'"logger":{_json_str(record.name)},"msg":{_json_str(record.getMessage())}{extra}}}'
+        )
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keep roughly `rate` (0..1) of records at or below `max_level`; records
+    above it (warnings and errors by default) always pass.
+    """
+
+    def __init__(self, rate: float, max_level: int = logging.INFO) -> None:
+        super().__init__()
+        self.rate = rate
+        self.max_level = max_level
+        self.suppressed = 0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > self.max_level or random.random() < self.rate:
+            return True
+        self.suppressed += 1
+        if metrics.enabled:
+            metrics.incr("logging.records.sampled_out")
+        return False
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Allow at most `per_second` records per call site (logger, file, line) in
+    each wall-clock second. Counts reset every second, so memory stays
+    bounded even when messages are built with f-strings.
+    """
+
+    def __init__(self, per_second: int) -> None:
+        super().__init__()
+        self.per_second = per_second
+        self.suppressed = 0
+        self._lock = threading.Lock()
+        self._window = -1
+        self._counts: dict[tuple[str, str, int], int] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        sec = int(record.created)
+        key = (record.name, record.pathname, record.lineno)
+        with self._lock:
+            if sec != self._window:
+                self._window = sec
+                self._counts = {}
+            n = self._counts[key] = self._counts.get(key, 0) + 1
+            if n <= self.per_second:
+                return True
+            self.suppressed += 1
+        if metrics.enabled:
+            metrics.incr("logging.records.rate_limited")
+        return False
+
+
+class _BatchStreamHandler(logging.StreamHandler):
+    """StreamHandler that can write a whole batch with one write + flush."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # Same as StreamHandler.emit, but only counts records that were written.
+        try:
+            msg = self.format(record)
+            self.stream.write(msg + self.terminator)
+            self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+            return
+        if metrics.enabled:
+            metrics.incr("logging.records.emitted")
+
+    def emit_batch(self, items: list[tuple[logging.Handler, logging.LogRecord]]) -> None:
+        """Write (handler, record) pairs, formatting each with the handler that queued it."""
+        parts = []
+        for handler, record in items:
+            try:
+                parts.append(handler.format(record) + self.terminator)
+            except Exception:
+                handler.handleError(record)
+        if not parts:
+            return
+        self.acquire()
+        try:
+            self.stream.write("".join(parts))
+            self.flush()
+            if metrics.enabled:
+                metrics.incr("logging.records.emitted", len(parts))
+        except Exception:
+            self.handleError(items[-1][1])
+        finally:
+            self.release()
+
+
+class _BatchWriter:
+    """
+    Background thread draining one bounded buffer into one stream. Every
+    queue-mode logger on the same stream with the same queue settings and
+    overflow policy shares a writer, so get_logger(__name__) across many
+    modules costs one thread, and one logger's policy never drops another
+    policy's records.
+
+    Producers only append to a deque (atomic under the GIL) and poke an
+    Event; nothing runs under a shared lock unless the buffer is full.
+    """
+
+    def __init__(self, stream: Any, queue_size: int, batch_size: int, overflow: str) -> None:
+        self.handler = _BatchStreamHandler(stream)
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.overflow = overflow
+        self.running = False
+        self._start()
+
+    def _start(self) -> None:
+        self._items: deque = deque()
+        self._wakeup = threading.Event()
+        self._space = threading.Condition()
+        self._blocked = 0
+        self._drop_lock = threading.Lock()
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+        self.running = True
+        self._thread.start()
+
+    def put(self, item: tuple[_BoundedQueueHandler, logging.LogRecord]) -> None:
+        if not self.running:
+            self.handler.emit_batch([item])
+            return
+
+        items = self._items
+        if len(items) >= self.queue_size:
+            if self.overflow == "drop_newest":
+                self._drop(item)
+                return
+            if self.overflow == "block":
+                self._wait_for_space()
+
+        items.append(item)
+        if self.overflow == "drop_oldest" and len(items) > self.queue_size:
+            try:
+                oldest = items.popleft()
+            except IndexError:
+                pass
+            else:
+                if oldest.__class__ is tuple:
+                    self._drop(oldest)
+                else:
+                    items.appendleft(oldest)  # a flush marker is never dropped
+        if not self._wakeup.is_set():
+            self._wakeup.set()
+
+    def _drop(self, item: tuple[_BoundedQueueHandler, logging.LogRecord]) -> None:
+        # Charged to the handler that queued the record, not the caller.
+        with self._drop_lock:
+            item[0].dropped += 1
+        if metrics.enabled:
+            metrics.incr("logging.records.dropped")
+
+    def _wait_for_space(self) -> None:
+        with self._space:
+            self._blocked += 1
+            try:
+                while self.running and len(self._items) >= self.queue_size:
+                    self._wakeup.set()
+                    self._space.wait(0.05)
+            finally:
+                self._blocked -= 1
+
+    def _run(self) -> None:
+        items = self._items
+        wakeup = self._wakeup
+        while True:
+            wakeup.wait()
+            wakeup.clear()
+            while items:
+                batch = []
+                markers = []
+                while items and len(batch) < self.batch_size:
+                    item = items.popleft()
+                    if item.__class__ is tuple:
+                        batch.append(item)
+                    else:
+                        markers.append(item)
+                if batch:
+                    self.handler.emit_batch(batch)
+                for marker in markers:
+                    marker.set()
+                if self._blocked:
+                    with self._space:
+                        self._space.notify_all()
+            if self._stopping:
+                return
+
+    def pending(self) -> int:
+        """Records (and flush markers) waiting for the writer thread."""
+        return len(self._items)
+
+    def flush(self) -> None:
+        """Wait until everything queued before this call has been written."""
+        if not self.running:
+            return
+        marker = threading.Event()
+        self._items.append(marker)
+        self._wakeup.set()
+        marker.wait()
+
+    def stop(self) -> None:
+        """Write everything queued so far, then end the thread."""
+        if not self.running:
+            return
+        self.running = False
+        self._stopping = True
+        self._wakeup.set()
+        self._thread.join()
+        # Records that raced with shutdown: write them here rather than lose them.
+        leftovers = []
+        while self._items:
+            item = self._items.popleft()
+            if item.__class__ is tuple:
+                leftovers.append(item)
+            else:
+                item.set()
+        if leftovers:
+            self.handler.emit_batch(leftovers)
+
+    def _after_fork_in_child(self) -> None:
+        # The parent's thread doesn't exist here and the buffer holds records
+        # (and lock states) that belong to the parent: start afresh.
+        if self.running:
+            self._start()
+
+
+class _BoundedQueueHandler(logging.Handler):
+    """
+    Hands records to a shared _BatchWriter, whose overflow policy applies
+    when its buffer is full:
+      - block:       wait for the writer thread to make room
+      - drop_oldest: discard the oldest queued record
+      - drop_newest: discard the record being logged
+
+    `dropped` counts this handler's records that were discarded. Once the
+    writer has been shut down, records are written synchronously instead.
+    """
+
+    def __init__(self, writer: _BatchWriter) -> None:
+        super().__init__()
+        self.writer = writer
+        self.dropped = 0
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        # Unlike Handler.handle, don't take the per-handler lock: the writer's
+        # buffer is thread-safe, and holding a lock here would serialize every
+        # producer (and, with overflow="block", hold it while waiting).
+        rv = self.filter(record)
+        if rv:
+            self.emit(record)
+        return bool(rv)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Work on a shallow copy so handlers further up the hierarchy still
+        # see the original template and args. Merge args now, in case the
+        # caller mutates them after logging; exc_info is kept because the
+        # buffer never leaves this process and the writer formats it.
+        copied = record.__class__.__new__(record.__class__)
+        copied.__dict__.update(record.__dict__)
+        if copied.args:
+            copied.msg = copied.getMessage()
+            copied.args = None
+        return copied
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.writer.put((self, self.prepare(record)))
+        except Exception:
+            self.handleError(record)
+
+
+def flush_queues() -> None:
+    """Block until every record queued by a queue-mode logger has been written."""
+    with _writers_lock:
+        writers = list(_writers.values())
+    for writer in writers:
+        writer.flush()
+
+
+@atexit.register
+def shutdown_queues() -> None:
+    """
+    Flush and stop all queue-mode writer threads. Runs at interpreter exit;
+    loggers used afterwards fall back to synchronous writes.
+    """
+    with _writers_lock:
+        writers = list(_writers.values())
+    for writer in writers:
+        writer.stop()
+
+
+def _after_fork_in_child() -> None:
+    global _writers_lock
+    _writers_lock = threading.Lock()
+    for writer in _writers.values():
+        writer._after_fork_in_child()
+
+
+os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
+def dropped_records(logger: logging.Logger) -> int:
+    """Number of records a queue-mode logger discarded because its queue was full."""
+    return sum(getattr(h, "dropped", 0) for h in logger.handlers)
+
+
+def suppressed_records(logger: logging.Logger) -> int:
+    """Number of records a logger's sampling/rate-limit filters discarded."""
+    return sum(getattr(f, "suppressed", 0) for f in logger.filters)
+
+
+def get_logger(
+    name: str,
+    level: str = "INFO",
+    mode: str = "stream",
+    *,
+    queue_size: int = 10_000,
+    overflow: str = "block",
+    batch_size: int = 256,
+    fmt: str = "text",
+    fields: dict[str, Any] | None = None,
+    sample_rate: float = 1.0,
+    rate_limit: int | None = None,
+) -> logging.Logger:
     """
     Minimal logger factory suitable for small internal services.
+
+    mode="stream" writes synchronously to stderr. mode="queue" only enqueues
+    on the calling thread; a background thread formats and writes records in
+    batches of up to `batch_size`. The queue holds at most `queue_size`
+    records and `overflow` ("block", "drop_oldest", "drop_newest") decides
+    what happens when it is full. Loggers with the same queue settings and
+    overflow policy share one buffer and thread, which is restarted in forked
+    children. Use flush_queues() to wait for pending records;
+    shutdown_queues() runs at interpreter exit.
+
+    Trade-off: queue mode still copies the record and merges its args on the
+    calling thread. With a fast sink (a file or /dev/null) that makes each
+    call about as expensive as a synchronous write, so it pays off when the
+    sink is slow (pipes, terminals, network filesystems) or contended; see
+    benchmarks/bench_logging.py.
+
+    fmt="json" emits one JSON object per line (see JsonFormatter) with
+    `fields` bound to every record. sample_rate < 1 keeps only that share of
+    DEBUG/INFO records, and rate_limit caps records per call site per second.
     """
+    if mode not in _MODES:
+        raise ValueError(f"Unsupported logger mode: {mode!r}")
+    if overflow not in _OVERFLOW_POLICIES:
+        raise ValueError(f"Unsupported overflow policy: {overflow!r}")
+    if fmt not in _FORMATS:
+        raise ValueError(f"Unsupported log format: {fmt!r}")
+
     logger = logging.getLogger(name)
     if logger.handlers:
         return logger  # already configured
 
     logger.setLevel(level.upper())
-    handler = logging.StreamHandler()
-    formatter = logging.Formatter(fmt="%(asctime)s %(levelname)s %(name)s - %(message)s")
+    formatter = JsonFormatter(fields) if fmt == "json" else logging.Formatter(fmt=_FORMAT)
+    if sample_rate < 1.0:
+        logger.addFilter(SamplingFilter(sample_rate))
+    if rate_limit is not None:
+        logger.addFilter(RateLimitFilter(rate_limit))
+
+    if mode == "stream":
+        handler = _BatchStreamHandler()
+        handler.setFormatter(formatter)
+        logger.addHandler(handler)
+        return logger
+
+    stream = sys.stderr
+    key = (id(stream), queue_size, batch_size, overflow)
+    with _writers_lock:
+        writer = _writers.get(key)
+        if writer is None or not writer.running:
+            writer = _writers[key] = _BatchWriter(stream, queue_size, batch_size, overflow)
+    handler = _BoundedQueueHandler(writer)
     handler.setFormatter(formatter)
     logger.addHandler(handler)
     return logger
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import atexit
+import os
+import sys
+import threading
+from bisect import bisect_left
+from typing import Any
+
+# Upper bounds (seconds) of the latency histogram buckets; the last bucket is +inf.
+BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+# Hot paths check this flag before calling into this module, so disabled
+# metrics cost one global lookup per call.
+# UTILS_METRICS=1 turns them on; UTILS_METRICS_DUMP=<path or -> also writes a
+# snapshot at exit.
+enabled = os.environ.get("UTILS_METRICS", "") not in ("", "0") or bool(os.environ.get("UTILS_METRICS_DUMP"))
+
+_lock = threading.Lock()
+_counters: dict[str, int] = {}
+_histograms: dict[str, list[float]] = {}  # name -> [count, sum, *bucket counts]
+
+
+def enable(on: bool = True) -> None:
+    global enabled
+    enabled = on
+
+
+def reset() -> None:
+    with _lock:
+        _counters.clear()
+        _histograms.clear()
+
+
+def incr(name: str, n: int = 1) -> None:
+    if not enabled:
+        return
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + n
+
+
+def observe(name: str, seconds: float) -> None:
+    """Record one latency sample in the fixed-bucket histogram `name`."""
+    if not enabled:
+        return
+    with _lock:
+        h = _histograms.get(name)
+        if h is None:
+            h = _histograms[name] = [0, 0.0] + [0] * (len(BUCKETS) + 1)
+        h[0] += 1
+        h[1] += seconds
+        h[2 + bisect_left(BUCKETS, seconds)] += 1
+
+
+def merge(snap: dict[str, Any]) -> None:
+    """Add a snapshot() taken elsewhere (e.g. in a worker process) into this process's metrics."""
+    if not enabled:
+        return
+    with _lock:
+        for name, n in snap["counters"].items():
+            _counters[name] = _counters.get(name, 0) + n
+        for name, data in snap["histograms"].items():
+            h = _histograms.get(name)
+            if h is None:
+                h = _histograms[name] = [0, 0.0] + [0] * (len(BUCKETS) + 1)
+            h[0] += data["count"]
+            h[1] += data["sum"]
+            for i, n in enumerate(data["buckets"].values()):
+                h[2 + i] += n
+
+
+def snapshot() -> dict[str, Any]:
+    """
+    Current values as plain data:
+      {"counters": {name: n},
+       "histograms": {name: {"count": n, "sum": s, "buckets": {"le_0.001": n, ..., "le_inf": n}}}}
+    Bucket counts are per bucket, not cumulative.
+    """
+    labels = [f"le_{b:g}" for b in BUCKETS] + ["le_inf"]
+    with _lock:
+        return {
+            "counters": dict(sorted(_counters.items())),
+            "histograms": {
+                name: {"count": int(h[0]), "sum": h[1], "buckets": dict(zip(labels, map(int, h[2:])))}
+                for name, h in sorted(_histograms.items())
+            },
+        }
+
+
+def dump(target: str = "-") -> None:
+    """Write snapshot() as JSON to a file path, or to stderr for "-"."""
+    import json
+
+    text = json.dumps(snapshot(), indent=2) + "\n"
+    if target == "-":
+        sys.stderr.write(text)
+    else:
+        with open(target, "w", encoding="utf-8") as f:
+            f.write(text)
+
+
+def _start_profiler(path: str) -> None:
+    # Profiles the importing thread from the first `utils` import until exit.
+    import cProfile
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+
+    def stop() -> None:
+        profiler.disable()
+        profiler.dump_stats(path)
+
+    atexit.register(stop)
+
+
+if os.environ.get("UTILS_METRICS_DUMP"):
+    atexit.register(dump, os.environ["UTILS_METRICS_DUMP"])
+
+if os.environ.get("UTILS_PROFILE"):
+    _start_profiler(os.environ["UTILS_PROFILE"])
@@ -1,4 +1,14 @@
-from cli import main
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from cli import _Timings, main
+
+SRC = Path(__file__).resolve().parents[1] / "src"
 
 
 def test_cli_parse_date_smoke(capsys):
@@ -7,3 +17,200 @@ def test_cli_parse_date_smoke(capsys):
     out = capsys.readouterr().out.strip()
     assert out == "2026-01-31"
 
+
+def test_cli_parse_date_stream_lines(tmp_path, capsys):
+    src = tmp_path / "dates.txt"
+    src.write_text("01/31/2026\nbogus\n12-25-2024\n", encoding="utf-8")
+    rejects = tmp_path / "rejects.tsv"
+    rc = main(["parse-date", "--input", str(src), "--rejects", str(rejects)])
+    assert rc == 1
+    assert capsys.readouterr().out.splitlines() == ["2026-01-31", "2024-12-25"]
+    assert rejects.read_text(encoding="utf-8") == "2\tbogus\n"
+
+
+def test_cli_parse_date_stream_csv_workers_keeps_order(tmp_path, capsys):
+    src = tmp_path / "dates.csv"
+    rows = [f"id{i};{(i % 12) + 1:02d}/{(i % 28) + 1:02d}/2026" for i in range(500)]
+    src.write_text("\n".join(rows) + "\n", encoding="utf-8")
+    rc = main(
+        ["parse-date", "--input", str(src), "--column", "1", "--delimiter", ";", "--workers", "2", "--chunk-size", "37"]
+    )
+    assert rc == 0
+    out = capsys.readouterr().out.splitlines()
+    assert out == [f"2026-{(i % 12) + 1:02d}-{(i % 28) + 1:02d}" for i in range(500)]
+
+
+def test_cli_parse_date_stream_escapes_rejected_values(tmp_path, capsys):
+    src = tmp_path / "dates.csv"
+    src.write_text('1,01/31/2026\n2,"01/31\n2026"\n3,a\tb\\c\n', encoding="utf-8")
+    rejects = tmp_path / "rejects.tsv"
+    rc = main(["parse-date", "--input", str(src), "--column", "1", "--rejects", str(rejects)])
+    assert rc == 1
+    assert capsys.readouterr().out.splitlines() == ["2026-01-31"]
+    assert rejects.read_text(encoding="utf-8").splitlines() == ["3\t01/31\\n2026", "4\ta\\tb\\\\c"]
+
+
+def test_cli_parse_date_rejects_multichar_delimiter(capsys):
+    with pytest.raises(SystemExit) as exc:
+        main(["parse-date", "--input", "-", "--column", "0", "--delimiter", ";;"])
+    assert exc.value.code == 2
+    assert "--delimiter must be a single character" in capsys.readouterr().err
+
+
+_IMPORT_CHECK = """
+import sys
+sys.path.insert(0, {src!r})
+from cli import _Timings, main
+main({argv!r})
+heavy = {heavy!r}
+print("loaded:" + ",".join(sorted(m for m in heavy if m in sys.modules)))
+"""
+
+
+def _modules_loaded_by(argv, heavy):
+    code = _IMPORT_CHECK.format(src=str(SRC), argv=argv, heavy=heavy)
+    proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return proc.stdout.strip().splitlines()[-1].removeprefix("loaded:")
+
+
+def test_cli_parse_date_does_not_import_heavy_modules():
+    heavy = ["yaml", "utils.config", "utils.logging", "json", "csv", "concurrent.futures", "multiprocessing"]
+    assert _modules_loaded_by(["parse-date", "01/31/2026"], heavy) == ""
+
+
+def test_cli_parse_date_stream_does_not_import_yaml(tmp_path):
+    src = tmp_path / "dates.txt"
+    src.write_text("01/31/2026\n", encoding="utf-8")
+    loaded = _modules_loaded_by(["parse-date", "--input", str(src)], ["yaml", "utils.config", "multiprocessing"])
+    assert loaded == ""
+
+
+def test_cli_timings_reports_phases(capsys):
+    rc = main(["--timings", "parse-date", "01/31/2026"])
+    assert rc == 0
+    err = capsys.readouterr().err
+    for phase in ("parse-args", "import", "run"):
+        assert f"[timings] {phase}" in err
+
+
+def test_cli_timings_count_nested_phases_once(monkeypatch):
+    clock = iter([0.0, 1.0, 3.0, 4.0])
+    monkeypatch.setattr(time, "perf_counter", lambda: next(clock))
+    timings = _Timings()
+    with timings.phase("run"):
+        with timings.phase("import"):
+            pass
+    assert timings.phases == {"import": 2.0, "run": 2.0}
+
+
+def _validate_tree(root, capsys, *extra):
+    rc = main(["validate-config", "--recursive", str(root), *extra])
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    return rc, {Path(r["path"]).relative_to(root).as_posix(): r for r in records}
+
+
+@pytest.fixture
+def config_tree(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    root = tmp_path / "tree"
+    root.mkdir()
+    return root
+
+
+def test_cli_validate_config_recursive_dedups_and_caches(config_tree, capsys):
+    root = config_tree
+    (root / "a").mkdir()
+    (root / "a" / "svc.yaml").write_text("service_name: billing-api\n", encoding="utf-8")
+    (root / "b.yaml").write_text("service_name: billing-api\n", encoding="utf-8")
+    (root / "bad.yaml").write_text("- not\n- a mapping\n", encoding="utf-8")
+    (root / "notes.txt").write_text("ignored\n", encoding="utf-8")
+
+    rc, records = _validate_tree(root, capsys, "--workers", "2")
+    assert rc == 1
+    assert sorted(records) == ["a/svc.yaml", "b.yaml", "bad.yaml"]
+    assert records["bad.yaml"]["status"] == "error"
+    assert "mapping" in records["bad.yaml"]["error"]
+    assert records["a/svc.yaml"]["status"] == records["b.yaml"]["status"] == "ok"
+    assert sorted([records["a/svc.yaml"]["source"], records["b.yaml"]["source"]]) == ["dedup", "parsed"]
+
+    rc, records = _validate_tree(root, capsys)
+    assert rc == 1
+    assert {r["source"] for r in records.values()} == {"cache"}
+
+    (root / "bad.yaml").write_text("service_name: fixed\n", encoding="utf-8")
+    rc, records = _validate_tree(root, capsys)
+    assert rc == 0
+    assert records["bad.yaml"]["source"] == "parsed"
+    assert records["bad.yaml"]["status"] == "ok"
+
+    # The cache lives in the user cache dir, never in the validated tree.
+    assert sorted(p.name for p in root.iterdir()) == ["a", "b.yaml", "bad.yaml", "notes.txt"]
+    assert list((config_tree.parent / "cache").rglob("*.json"))
+
+
+def test_cli_validate_config_recursive_no_cache(config_tree, capsys):
+    (config_tree / "svc.yml").write_text("service_name: billing-api\n", encoding="utf-8")
+    rc, records = _validate_tree(config_tree, capsys, "--glob", "*.yml", "--no-cache")
+    assert rc == 0
+    assert records["svc.yml"]["source"] == "parsed"
+    assert not (config_tree.parent / "cache").exists()
+
+
+def test_cli_validate_config_recursive_unwritable_cache(config_tree, capsys):
+    (config_tree / "svc.yaml").write_text("service_name: billing-api\n", encoding="utf-8")
+    blocker = config_tree.parent / "not-a-dir"
+    blocker.write_text("", encoding="utf-8")
+    rc = main(["validate-config", "--recursive", str(config_tree), "--cache", str(blocker / "c.json")])
+    out, err = capsys.readouterr()
+    assert rc == 0
+    assert json.loads(out)["status"] == "ok"
+    assert "could not write result cache" in err
+
+
+def test_cli_validate_config_recursive_unreadable_file(config_tree, capsys, monkeypatch):
+    (config_tree / "ok.yaml").write_text("service_name: billing-api\n", encoding="utf-8")
+    (config_tree / "locked.yaml").write_text("service_name: locked\n", encoding="utf-8")
+    read_bytes = Path.read_bytes
+
+    def flaky_read_bytes(self):
+        if self.name == "locked.yaml":
+            raise PermissionError(13, "Permission denied")
+        return read_bytes(self)
+
+    monkeypatch.setattr(Path, "read_bytes", flaky_read_bytes)
+    rc, records = _validate_tree(config_tree, capsys, "--no-cache")
+    assert rc == 1
+    assert records["ok.yaml"]["status"] == "ok"
+    assert records["locked.yaml"]["status"] == "error"
+    assert "Permission denied" in records["locked.yaml"]["error"]
+
+
+@pytest.mark.parametrize("target", ["missing", "file.yaml"])
+def test_cli_validate_config_recursive_rejects_non_directory(config_tree, capsys, target):
+    (config_tree / "file.yaml").write_text("service_name: billing-api\n", encoding="utf-8")
+    with pytest.raises(SystemExit) as exc:
+        main(["validate-config", "--recursive", str(config_tree / target)])
+    assert exc.value.code == 2
+    assert "not a directory" in capsys.readouterr().err
+
+
+def test_cli_validate_config_recursive_fails_when_nothing_matches(config_tree, capsys):
+    (config_tree / "svc.yaml").write_text("service_name: billing-api\n", encoding="utf-8")
+    rc, records = _validate_tree(config_tree, capsys, "--glob", "*.yml")
+    assert rc == 1
+    assert records == {}
+
+
+def test_cli_timings_reports_import_phase_in_stream_mode(tmp_path, capsys):
+    src = tmp_path / "dates.txt"
+    src.write_text("01/31/2026\n", encoding="utf-8")
+    assert main(["--timings", "parse-date", "--input", str(src)]) == 0
+    err = capsys.readouterr().err
+    for phase in ("parse-args", "import", "run"):
+        assert f"[timings] {phase}" in err
+
+
+def test_cli_timings_reports_import_phase_in_recursive_mode(config_tree, capsys):
+    (config_tree / "svc.yaml").write_text("service_name: billing-api\n", encoding="utf-8")
+    assert main(["--timings", "validate-config", "--recursive", str(config_tree)]) == 0
+    assert "[timings] import" in capsys.readouterr().err
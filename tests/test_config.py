@@ -2,6 +2,7 @@ from pathlib import Path
 
 import pytest
 
+from utils import config
 from utils.config import ConfigError, load_yaml_config
 
 
@@ -18,3 +19,47 @@ def test_load_yaml_config_normalizes_defaults(tmp_path: Path):
     assert cfg["environment"] == "dev"
     assert cfg["log_level"] == "INFO"
 
+
+def test_load_yaml_config_cache_is_copy_on_read(tmp_path: Path):
+    p = tmp_path / "cfg.yaml"
+    p.write_text("service_name: billing-api\nfeatures: [a, b]\n", encoding="utf-8")
+    first = load_yaml_config(p)
+    first["features"].append("mutated")
+    first["service_name"] = "mutated"
+    second = load_yaml_config(p)
+    assert second["service_name"] == "billing-api"
+    assert second["features"] == ["a", "b"]
+
+
+def test_load_yaml_config_cache_sees_file_changes(tmp_path: Path):
+    p = tmp_path / "cfg.yaml"
+    p.write_text("service_name: billing-api\n", encoding="utf-8")
+    assert load_yaml_config(p)["service_name"] == "billing-api"
+    p.write_text("service_name: payments-api\n", encoding="utf-8")
+    assert load_yaml_config(p)["service_name"] == "payments-api"
+
+
+def test_load_yaml_config_snapshot_skips_yaml(tmp_path: Path, monkeypatch):
+    p = tmp_path / "cfg.yaml"
+    p.write_text("service_name: billing-api\nreplicas: 3\n", encoding="utf-8")
+    cfg = load_yaml_config(p, use_cache=False, snapshot=True)
+    assert (tmp_path / ".cfg.yaml.snapshot").exists()
+
+    def boom(*args, **kwargs):
+        raise AssertionError("YAML should not be parsed when the snapshot is fresh")
+
+    monkeypatch.setattr(config.yaml, "load", boom)
+    assert load_yaml_config(p, use_cache=False, snapshot=True) == cfg
+
+
+def test_load_yaml_config_snapshot_ignored_when_source_changes(tmp_path: Path):
+    p = tmp_path / "cfg.yaml"
+    p.write_text("service_name: billing-api\n", encoding="utf-8")
+    load_yaml_config(p, use_cache=False, snapshot=True)
+    p.write_text("service_name: payments-api\n", encoding="utf-8")
+    assert load_yaml_config(p, use_cache=False, snapshot=True)["service_name"] == "payments-api"
+
+
+def test_load_yaml_config_unreadable_path_is_config_error(tmp_path: Path):
+    with pytest.raises(ConfigError):
+        load_yaml_config(tmp_path)
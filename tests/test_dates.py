@@ -1,4 +1,9 @@
-from utils.dates import parse_date
+from array import array
+from datetime import date
+
+import pytest
+
+from utils.dates import DateFormatInferer, DateParseError, parse_date, parse_dates
 
 
 def test_parse_us_date_mmddyyyy():
@@ -11,3 +16,66 @@ def test_parse_eu_date_ddmmyyyy():
     d = parse_date("31/01/2026")
     assert d.year == 2026 and d.month == 1 and d.day == 31
 
+
+def test_parse_dates_matches_parse_date():
+    values = ["01/31/2026", " 12-25-2024 ", "01/31/2026", "", None, "13/13/2026", "1/2", "01/01/1899"]
+    result = parse_dates(values)
+    assert isinstance(result.values, array)
+    assert list(result.errors) == [0, 0, 0, 1, 1, 1, 1, 1]
+    assert result.error_count == 5
+    assert date.fromordinal(result.values[0]) == parse_date("01/31/2026")
+    assert date.fromordinal(result.values[1]) == parse_date("12-25-2024")
+
+
+def test_parse_dates_date_output():
+    result = parse_dates(["01/31/2026", "bogus"], out="date")
+    assert result.values == [date(2026, 1, 31), None]
+    assert list(result.errors) == [0, 1]
+
+
+def test_parse_dates_numpy_output():
+    np = pytest.importorskip("numpy")
+    result = parse_dates(["01/31/2026", "bogus"], out="numpy")
+    assert result.values.dtype == np.dtype("datetime64[D]")
+    assert result.values[0] == np.datetime64("2026-01-31")
+    assert np.isnat(result.values[1])
+    assert result.errors.tolist() == [False, True]
+
+
+def test_parse_dates_rejects_unknown_output():
+    with pytest.raises(ValueError):
+        parse_dates([], out="pandas")
+
+
+def test_date_format_inferer_picks_day_first_from_unambiguous_rows():
+    column = ["03/04/2026", "01/02/2026"] * 10 + ["31/01/2026", "15/06/2025", "28/02/2024"]
+    fmt = DateFormatInferer(min_evidence=3).infer(column)
+    assert fmt.sep == "/" and fmt.day_first
+    assert fmt.pattern == "DD/MM/YYYY"
+    assert fmt.confidence == 1.0
+    parse = fmt.compile()
+    assert parse("03/04/2026") == date(2026, 4, 3)
+    with pytest.raises(DateParseError):
+        parse("12-25-2024")
+
+
+def test_date_format_inferer_stops_early_once_clear():
+    column = iter(["12-25-2024"] * 1_000)
+    fmt = DateFormatInferer(min_evidence=20).infer(column)
+    assert fmt.sep == "-" and not fmt.day_first
+    assert fmt.sampled == 20
+    assert len(list(column)) == 980
+
+
+def test_date_format_inferer_all_ambiguous_defaults_to_month_first():
+    fmt = DateFormatInferer().infer(["03/04/2026", "05/06/2026"])
+    assert not fmt.day_first
+    assert fmt.confidence == 0.0
+    assert fmt.sampled == 2
+
+
+def test_parse_dates_with_inferred_format():
+    column = ["31/01/2026", "03/04/2026", "bogus"]
+    fmt = DateFormatInferer().infer(column)
+    result = parse_dates(column, out="date", fmt=fmt)
+    assert result.values == [date(2026, 1, 31), date(2026, 4, 3), None]
@@ -0,0 +1,250 @@
+import contextlib
+import json
+import logging
+import os
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from utils.logging import (
+    JsonFormatter,
+    RateLimitFilter,
+    SamplingFilter,
+    dropped_records,
+    flush_queues,
+    get_logger,
+    shutdown_queues,
+    suppressed_records,
+)
+
+
+def _record(msg: str) -> logging.LogRecord:
+    return logging.LogRecord("t", logging.INFO, __file__, 1, msg, None, None)
+
+
+class _StalledStream:
+    """Stream whose writes block until released, holding the writer thread."""
+
+    def __init__(self) -> None:
+        self.released = threading.Event()
+        self.lines: list[str] = []
+
+    def write(self, s: str) -> None:
+        self.released.wait(10)
+        self.lines.extend(s.splitlines())
+
+    def flush(self) -> None:
+        pass
+
+
+def _stalled_queue_logger(name: str, overflow: str) -> tuple[logging.Logger, _StalledStream]:
+    stream = _StalledStream()
+    with contextlib.redirect_stderr(stream):
+        logger = get_logger(name, mode="queue", queue_size=1, batch_size=1, overflow=overflow)
+    logger.info("m0")  # the writer takes this one and blocks writing it
+    deadline = time.monotonic() + 5
+    while logger.handlers[0].writer.pending():
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+    return logger, stream
+
+
+def test_get_logger_queue_mode_writes_everything_on_flush(capsys):
+    logger = get_logger("test.queue.flush", mode="queue", batch_size=8)
+    for i in range(50):
+        logger.info("record %d", i)
+    flush_queues()
+    lines = capsys.readouterr().err.splitlines()
+    assert len(lines) == 50
+    assert lines[0].endswith("INFO test.queue.flush - record 0")
+    assert lines[-1].endswith("record 49")
+
+
+def test_queue_drop_newest_counts_drops():
+    logger, stream = _stalled_queue_logger("test.queue.drop_newest", "drop_newest")
+    for i in range(1, 5):
+        logger.info("m%d", i)
+    assert dropped_records(logger) == 3
+    stream.released.set()
+    flush_queues()
+    assert [line.rsplit(" ", 1)[-1] for line in stream.lines] == ["m0", "m1"]
+
+
+def test_queue_drop_oldest_keeps_latest():
+    logger, stream = _stalled_queue_logger("test.queue.drop_oldest", "drop_oldest")
+    for i in range(1, 5):
+        logger.info("m%d", i)
+    assert dropped_records(logger) == 3
+    stream.released.set()
+    flush_queues()
+    assert [line.rsplit(" ", 1)[-1] for line in stream.lines] == ["m0", "m4"]
+
+
+def test_queue_overflow_policies_do_not_drop_each_others_records():
+    stream = _StalledStream()
+    with contextlib.redirect_stderr(stream):
+        audit = get_logger("test.queue.mixed.audit", mode="queue", queue_size=1, batch_size=1, overflow="block")
+        noisy = get_logger("test.queue.mixed.noisy", mode="queue", queue_size=1, batch_size=1, overflow="drop_oldest")
+    assert audit.handlers[0].writer is not noisy.handlers[0].writer
+    audit.info("a0")
+    noisy.info("b0")
+    noisy.info("b1")
+    noisy.info("b2")
+    stream.released.set()
+    audit.info("a1")
+    audit.info("a2")
+    flush_queues()
+    messages = [line.rsplit(" ", 1)[-1] for line in stream.lines]
+    assert [m for m in messages if m.startswith("a")] == ["a0", "a1", "a2"]
+    assert dropped_records(audit) == 0
+    assert dropped_records(noisy) == 3 - sum(m.startswith("b") for m in messages)
+
+
+def test_queue_writer_stops_while_drop_oldest_producers_keep_logging():
+    logger, stream = _stalled_queue_logger("test.queue.stop_race", "drop_oldest")
+    writer = logger.handlers[0].writer
+    done = threading.Event()
+
+    def spam():
+        while not done.is_set():
+            logger.info("spam")
+
+    producer = threading.Thread(target=spam)
+    producer.start()
+    stopper = threading.Thread(target=writer.stop)
+    stopper.start()
+    stream.released.set()
+    stopper.join(5)
+    done.set()
+    producer.join(5)
+    assert not stopper.is_alive()
+
+
+def test_queue_loggers_share_one_writer_per_stream(capsys):
+    a = get_logger("test.queue.shared.a", mode="queue")
+    b = get_logger("test.queue.shared.b", mode="queue", fmt="json")
+    assert a.handlers[0].writer is b.handlers[0].writer
+    a.info("from a")
+    b.info("from b")
+    flush_queues()
+    lines = capsys.readouterr().err.splitlines()
+    assert lines[0].endswith("test.queue.shared.a - from a")
+    assert json.loads(lines[1])["msg"] == "from b"
+
+
+def test_queue_handler_leaves_propagated_record_intact(capsys):
+    seen = []
+
+    class Capture(logging.Handler):
+        def emit(self, record):
+            seen.append((record.msg, record.args))
+
+    parent = logging.getLogger("test.queue.parent")
+    parent.addHandler(Capture())
+    logger = get_logger("test.queue.parent.child", mode="queue")
+    logger.info("user %s", "alice")
+    flush_queues()
+    assert seen == [("user %s", ("alice",))]
+    assert capsys.readouterr().err.strip().endswith("user alice")
+
+
+_FORK_SCRIPT = """
+import os, sys
+sys.path.insert(0, {src!r})
+from utils.logging import get_logger
+log = get_logger("forked", mode="queue", queue_size=5)
+log.info("parent before fork")
+pid = os.fork()
+if pid == 0:
+    for i in range(10):
+        log.info("child %d", i)
+    sys.exit(0)
+os.waitpid(pid, 0)
+log.info("parent after fork")
+"""
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs os.fork")
+def test_queue_logger_survives_fork():
+    src = Path(__file__).resolve().parents[1] / "src"
+    proc = subprocess.run(
+        [sys.executable, "-c", _FORK_SCRIPT.format(src=str(src))], capture_output=True, text=True, timeout=30
+    )
+    assert proc.returncode == 0
+    messages = [line.split(" - ", 1)[1] for line in proc.stderr.splitlines()]
+    assert messages.count("parent before fork") == 1
+    assert [m for m in messages if m.startswith("child")] == [f"child {i}" for i in range(10)]
+    assert messages[-1] == "parent after fork"
+
+
+def test_queue_logger_writes_synchronously_after_shutdown(capsys):
+    logger = get_logger("test.queue.shutdown", mode="queue")
+    shutdown_queues()
+    logger.info("after shutdown")
+    assert capsys.readouterr().err.strip().endswith("after shutdown")
+
+
+def test_get_logger_rejects_unknown_mode():
+    with pytest.raises(ValueError):
+        get_logger("test.queue.bad", mode="async")
+
+
+def test_json_formatter_emits_one_object_with_bound_fields():
+    formatter = JsonFormatter({"service": "billing-api", "pod": 3})
+    record = _record('quote " and %s')
+    record.args = ("args",)
+    payload = json.loads(formatter.format(record))
+    assert payload["level"] == "INFO"
+    assert payload["logger"] == "t"
+    assert payload["msg"] == 'quote " and args'
+    assert payload["service"] == "billing-api" and payload["pod"] == 3
+    assert payload["ts"].endswith("Z") and len(payload["ts"]) == len("2026-01-31T12:00:00.123Z")
+
+
+def test_json_formatter_includes_exception():
+    try:
+        raise RuntimeError("boom")
+    except RuntimeError:
+        record = logging.LogRecord("t", logging.ERROR, __file__, 1, "failed", None, sys.exc_info())
+    payload = json.loads(JsonFormatter().format(record))
+    assert "RuntimeError: boom" in payload["exc"]
+
+
+def test_get_logger_json_mode(capsys):
+    logger = get_logger("test.json.stream", fmt="json", fields={"env": "prod"})
+    logger.warning("disk at %d%%", 91)
+    payload = json.loads(capsys.readouterr().err)
+    assert payload["msg"] == "disk at 91%"
+    assert payload["env"] == "prod"
+
+
+def test_rate_limit_filter_caps_per_call_site():
+    f = RateLimitFilter(per_second=3)
+    records = [_record("hot loop") for _ in range(10)]
+    for r in records:
+        r.created = 1_800_000_000.5
+    kept = [f.filter(r) for r in records]
+    assert kept.count(True) == 3
+    assert f.suppressed == 7
+
+
+def test_sampling_filter_never_drops_errors():
+    f = SamplingFilter(rate=0.0)
+    error = _record("e")
+    error.levelno = logging.ERROR
+    assert f.filter(error)
+    assert not f.filter(_record("i"))
+    assert f.suppressed == 1
+
+
+def test_get_logger_rate_limit_reports_suppressed(capsys):
+    logger = get_logger("test.json.ratelimited", rate_limit=2)
+    for _ in range(5):
+        logger.error("same call site")
+    lines = capsys.readouterr().err.splitlines()
+    assert 2 <= len(lines) <= 4
+    assert len(lines) + suppressed_records(logger) == 5
@@ -0,0 +1,139 @@
+import json
+import logging
+import sys
+from pathlib import Path
+
+import pytest
+
+from cli import main
+from utils import metrics
+from utils.config import clear_config_cache, load_yaml_config
+from utils.dates import DateFormat, parse_date, parse_dates
+from utils.logging import get_logger
+
+
+@pytest.fixture
+def enabled_metrics(monkeypatch):
+    metrics.reset()
+    monkeypatch.setattr(metrics, "enabled", True)
+    yield
+    metrics.reset()
+
+
+def test_metrics_disabled_records_nothing(monkeypatch):
+    metrics.reset()
+    monkeypatch.setattr(metrics, "enabled", False)
+    metrics.incr("x")
+    metrics.observe("y", 0.1)
+    parse_date("01/31/2026")
+    assert metrics.snapshot() == {"counters": {}, "histograms": {}}
+
+
+def test_metrics_histogram_buckets(enabled_metrics):
+    metrics.observe("lat", 0.0002)
+    metrics.observe("lat", 0.0002)
+    metrics.observe("lat", 10.0)
+    h = metrics.snapshot()["histograms"]["lat"]
+    assert h["count"] == 3
+    assert h["sum"] == pytest.approx(10.0004)
+    assert h["buckets"]["le_0.0005"] == 2
+    assert h["buckets"]["le_inf"] == 1
+
+
+def test_parse_date_counts_errors_by_reason(enabled_metrics):
+    parse_date("01/31/2026")
+    for bad in ("", "20260131", "01/31/1800"):
+        with pytest.raises(ValueError):
+            parse_date(bad)
+    parse_dates(["01/31/2026", "bogus"])
+    counters = metrics.snapshot()["counters"]
+    assert counters["dates.parse_date.calls"] == 4
+    assert counters["dates.parse_date.errors.empty"] == 1
+    assert counters["dates.parse_date.errors.format"] == 1
+    assert counters["dates.parse_date.errors.year_range"] == 1
+    assert counters["dates.parse_dates.rows"] == 2
+    assert counters["dates.parse_dates.errors"] == 1
+    assert counters["dates.parse_dates.errors.format"] == 1
+
+
+def test_parse_dates_counts_errors_by_reason(enabled_metrics):
+    values = ["01/31/2026", "", None, "bogus", "01/xx/2026", "01/31/1800", "02/30/2026", "02/30/2026"]
+    parse_dates(values)
+    fmt = DateFormat(sep="/", day_first=True, confidence=1.0, sampled=1)
+    parse_dates(["31/01/2026", "31-01-2026", "31/01/1800"], fmt=fmt)
+    counters = metrics.snapshot()["counters"]
+    assert counters["dates.parse_dates.rows"] == 11
+    assert counters["dates.parse_dates.errors"] == 9
+    assert counters["dates.parse_dates.errors.empty"] == 2
+    assert counters["dates.parse_dates.errors.format"] == 2
+    assert counters["dates.parse_dates.errors.non_integer"] == 1
+    assert counters["dates.parse_dates.errors.year_range"] == 2
+    assert counters["dates.parse_dates.errors.invalid"] == 2
+
+
+def test_load_yaml_config_counts_cache_hits(enabled_metrics, tmp_path: Path):
+    clear_config_cache()
+    p = tmp_path / "cfg.yaml"
+    p.write_text("service_name: billing-api\n", encoding="utf-8")
+    load_yaml_config(p)
+    load_yaml_config(p)
+    snap = metrics.snapshot()
+    assert snap["counters"]["config.cache.misses"] == 1
+    assert snap["counters"]["config.cache.hits"] == 1
+    assert snap["histograms"]["config.parse.seconds"]["count"] == 1
+
+
+def test_logger_counts_emitted_records(enabled_metrics, capsys):
+    logger = get_logger("test.metrics.emitted")
+    logger.info("one")
+    logger.info("two")
+    assert metrics.snapshot()["counters"]["logging.records.emitted"] == 2
+
+
+def test_logger_does_not_count_failed_writes(enabled_metrics, monkeypatch):
+    class _BrokenStream:
+        def write(self, s):
+            raise OSError("disk full")
+
+        def flush(self):
+            pass
+
+    monkeypatch.setattr(logging, "raiseExceptions", False)
+    monkeypatch.setattr(sys, "stderr", _BrokenStream())
+    logger = get_logger("test.metrics.failed_write")
+    logger.info("lost")
+    assert "logging.records.emitted" not in metrics.snapshot()["counters"]
+
+
+def test_cli_stats_dumps_snapshot(monkeypatch, capsys):
+    metrics.reset()
+    monkeypatch.setattr(metrics, "enabled", False)
+    assert main(["--stats", "parse-date", "01/31/2026"]) == 0
+    out, err = capsys.readouterr()
+    assert out.strip() == "2026-01-31"
+    assert json.loads(err)["counters"]["dates.parse_date.calls"] == 1
+    metrics.reset()
+
+
+def test_metrics_merge_adds_worker_snapshot(enabled_metrics):
+    metrics.incr("rows", 2)
+    metrics.observe("lat", 0.0002)
+    metrics.merge({"counters": {"rows": 3}, "histograms": metrics.snapshot()["histograms"]})
+    snap = metrics.snapshot()
+    assert snap["counters"]["rows"] == 5
+    assert snap["histograms"]["lat"]["count"] == 2
+    assert snap["histograms"]["lat"]["buckets"]["le_0.0005"] == 2
+
+
+def test_cli_stats_includes_pool_worker_metrics(monkeypatch, capsys, tmp_path):
+    metrics.reset()
+    monkeypatch.setattr(metrics, "enabled", False)
+    src = tmp_path / "dates.txt"
+    src.write_text("01/31/2026\nbogus\n" * 50, encoding="utf-8")
+    argv = ["--stats", "parse-date", "--input", str(src), "--workers", "2", "--chunk-size", "10"]
+    rc = main([*argv, "--rejects", str(tmp_path / "rejects.tsv")])
+    assert rc == 1
+    counters = json.loads(capsys.readouterr().err)["counters"]
+    assert counters["dates.parse_dates.rows"] == 100
+    assert counters["dates.parse_dates.errors"] == 50
+    metrics.reset()